@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared plumbing for the scripted agent runners.
+
+The entry scripts only describe their prompts; sending them, printing the
+exchange and timing the run happens here.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Coroutine, Optional, Sequence
+
+from dotenv import load_dotenv
+from google.adk.agents import BaseAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.cli.utils import logs
+from google.adk.runners import InMemoryRunner
+from google.adk.sessions import Session
+from google.genai import types
+
+# Optional faster event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Set ADK_VERBOSE=1 to print each prompt as the full Content the runner receives
+VERBOSE = os.environ.get("ADK_VERBOSE", "").lower() in ("1", "true", "yes")
+
+RULE = "=" * 40
+
+
+def user_content(text: str) -> types.Content:
+    """Wrap text as a user turn."""
+    return types.Content(role='user', parts=[types.Part.from_text(text=text)])
+
+
+def prompt_text(content: types.Content) -> str:
+    """Return a prompt as plain text for the transcript, decoding it if it was sent as a blob."""
+    part = content.parts[0]
+    if part.text is not None:
+        return part.text
+    return part.inline_data.data.decode('utf-8', 'replace')
+
+
+async def run_scripted(
+    agent: BaseAgent,
+    scenarios: Sequence[Sequence[types.Content]],
+    *,
+    app_name: str,
+    user_id: str,
+    title: str,
+    speaker: str = 'User',
+    session_count: int = 1,
+    final_prompt: Optional[types.Content] = None,
+    run_config: Optional[RunConfig] = None,
+    label_key: Optional[str] = None,
+):
+    """Send scripted conversations to agent and print the exchange and timing.
+
+    Each scenario is a sequence of prompts that build on each other and are
+    sent in order. Scenarios are independent and run at the same time, each
+    borrowing one of session_count sessions for its whole run; if there are
+    more scenarios than sessions, the extra ones wait and continue in a
+    session another scenario has finished with. final_prompt, if given, is
+    sent in every session once all scenarios are done.
+
+    With more than one session, transcript lines start with the session's
+    label, e.g. '[session 2]'. If label_key is given the label is also stored
+    in each session's state under that key, for tools that ask the operator
+    something and need to say which conversation they are asking for.
+    """
+    runner = InMemoryRunner(agent=agent, app_name=app_name)
+    labels = [f'session {n}' for n in range(1, session_count + 1)]
+    sessions = await asyncio.gather(*(
+        runner.session_service.create_session(
+            app_name=app_name,
+            user_id=user_id,
+            state={label_key: label} if label_key else None,
+        )
+        for label in labels
+    ))
+    session_labels = {session.id: label for session, label in zip(sessions, labels)}
+    session_pool = asyncio.Queue()
+    for session in sessions:
+        session_pool.put_nowait(session)
+
+    async def run_prompt(session: Session, content: types.Content):
+        prefix = f'[{session_labels[session.id]}] ' if session_count > 1 else ''
+        if VERBOSE:
+            print(f'{prefix}** {speaker} says:', content.model_dump(exclude_none=True))
+        else:
+            print(f'{prefix}** {speaker} says:', prompt_text(content))
+        async for event in runner.run_async(
+            user_id=user_id,
+            session_id=session.id,
+            new_message=content,
+            run_config=run_config,
+        ):
+            parts = event.content.parts
+            text = parts[0].text if parts else None
+            if text:
+                print(f'{prefix}** {event.author}: {text}')
+
+    async def run_scenario(prompts: Sequence[types.Content]):
+        # A scenario's prompts build on each other, so it keeps one session until it is done
+        session = await session_pool.get()
+        try:
+            for content in prompts:
+                await run_prompt(session, content)
+        finally:
+            session_pool.put_nowait(session)
+
+    start_time = time.time()
+    print('Start time:', start_time)
+    print(RULE)
+    print(title)
+    print(RULE)
+
+    await asyncio.gather(*(run_scenario(prompts) for prompts in scenarios))
+
+    if final_prompt is not None:
+        await asyncio.gather(*(
+            run_prompt(session, final_prompt) for session in sessions
+        ))
+
+    for session in sessions:
+        print(
+            await runner.artifact_service.list_artifact_keys(
+                app_name=app_name, user_id=user_id, session_id=session.id
+            )
+        )
+    end_time = time.time()
+    print(RULE)
+    print('End time:', end_time)
+    print('Total time:', end_time - start_time)
+
+
+def run(main: Coroutine, dotenv_path: Optional[Path] = None):
+    """Load .env, send ADK logs to the tmp folder and run main, on uvloop if installed.
+
+    Pass dotenv_path to load the .env next to the entry script; otherwise
+    it is searched for from this module's directory, the repository root.
+    """
+    load_dotenv(dotenv_path, override=True)
+    logs.log_to_tmp_folder()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    asyncio.run(main)
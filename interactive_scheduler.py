@@ -5,18 +5,59 @@ Allows you to test the interview scheduling agent with custom scenarios.
 """
 
 import asyncio
+import atexit
+import os
+import sys
 from interview_scheduler_agent import agent
+from interview_scheduler_agent.console_io import ainput
 from dotenv import load_dotenv
 from google.adk.cli.utils import logs
 from google.adk.runners import InMemoryRunner
 from google.genai import types
 
+# Optional faster event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional line editing and history for the chat prompt (not available on Windows)
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+HISTORY_FILE = os.path.expanduser("~/.interview_scheduler_history")
+
+BANNER = (
+    "🤖 Interview Scheduling Agent Ready!\n"
+    + "=" * 50 + "\n"
+    "I can help you schedule interviews by:\n"
+    "• Calling candidates to check availability\n"
+    "• Scheduling calendar appointments\n"
+    "• Sending confirmation emails\n"
+    "• Keeping track of all interactions\n"
+    "\nType 'quit' to exit\n\n"
+    # Sample scenarios for inspiration
+    "💡 Sample scenarios to try:\n"
+    "1. 'Schedule an interview for John Doe (john@email.com, +1-555-1234) for a Data Scientist role'\n"
+    "2. 'I need to coordinate interviews for 3 candidates this week'\n"
+    "3. 'Can you check what interviews we have scheduled so far?'\n"
+    "4. 'Sarah needs to reschedule her interview - can you help?'\n"
+    + "-" * 50 + "\n"
+)
+
 load_dotenv(override=True)
 logs.log_to_tmp_folder()
 
 async def interactive_session():
     """Run an interactive session with the interview scheduling agent."""
     
+    # Let stdout flush on newlines instead of on every streamed chunk
+    sys.stdout.reconfigure(line_buffering=True, write_through=False)
+    
     app_name = 'interactive_scheduler'
     user_id = 'recruiter_interactive'
     
@@ -25,30 +66,18 @@ async def interactive_session():
         app_name=app_name,
     )
     
-    session = await runner.session_service.create_session(
-        app_name=app_name, user_id=user_id
+    # Create the session in the background while the banner is shown and the
+    # user types their first message; it is awaited before the first turn.
+    session_task = asyncio.create_task(
+        runner.session_service.create_session(app_name=app_name, user_id=user_id)
     )
     
-    print("🤖 Interview Scheduling Agent Ready!")
-    print("=" * 50)
-    print("I can help you schedule interviews by:")
-    print("• Calling candidates to check availability")
-    print("• Scheduling calendar appointments") 
-    print("• Sending confirmation emails")
-    print("• Keeping track of all interactions")
-    print("\nType 'quit' to exit\n")
-    
-    # Sample scenarios for inspiration
-    print("💡 Sample scenarios to try:")
-    print("1. 'Schedule an interview for John Doe (john@email.com, +1-555-1234) for a Data Scientist role'")
-    print("2. 'I need to coordinate interviews for 3 candidates this week'")
-    print("3. 'Can you check what interviews we have scheduled so far?'")
-    print("4. 'Sarah needs to reschedule her interview - can you help?'")
-    print("-" * 50)
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
     
     while True:
         try:
-            user_input = input("\n🧑‍💼 You: ")
+            user_input = await ainput("\n🧑‍💼 You: ")
             
             if user_input.lower() in ['quit', 'exit', 'q']:
                 print("\n👋 Goodbye! Thanks for using the Interview Scheduler!")
@@ -62,18 +91,26 @@ async def interactive_session():
                 role='user', parts=[types.Part.from_text(text=user_input)]
             )
             
-            print("🤖 Agent:", end=" ")
-            response_parts = []
+            session = await session_task
+            
+            print("🤖 Agent:", end=" ", flush=True)
             
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session.id,
-                new_message=content,
-            ):
-                if event.content.parts and event.content.parts[0].text:
-                    text = event.content.parts[0].text
-                    print(text, end="", flush=True)
-                    response_parts.append(text)
+            # Written as each event arrives, so text the agent says before a tool
+            # call is on screen before that tool prints or prompts; the line
+            # buffering set up above keeps this from flushing on every chunk
+            write = sys.stdout.write
+            try:
+                async for event in runner.run_async(
+                    user_id=user_id,
+                    session_id=session.id,
+                    new_message=content,
+                ):
+                    parts = event.content.parts
+                    text = parts[0].text if parts else None
+                    if text:
+                        write(text)
+            finally:
+                sys.stdout.flush()
             
             print()  # New line after agent response
             
@@ -84,10 +121,36 @@ async def interactive_session():
             print(f"\n❌ Error: {e}")
             print("Please try again.")
 
+def setup_readline():
+    """Enable line editing and load the persistent prompt history."""
+    if not READLINE_AVAILABLE:
+        return
+    readline.set_history_length(1000)
+    readline.parse_and_bind("tab: complete")
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    atexit.register(save_history)
+
+def save_history():
+    """Write the prompt history back to disk."""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
 def main():
     """Main entry point."""
     print("Starting Interactive Interview Scheduler...")
-    asyncio.run(interactive_session())
+    setup_readline()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    try:
+        asyncio.run(interactive_session())
+    except KeyboardInterrupt:
+        # Ctrl-C while the agent was answering rather than at the prompt
+        print("\n\n👋 Goodbye! Thanks for using the Interview Scheduler!")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -1,11 +1,114 @@
+import asyncio
+import contextlib
 import datetime
-from typing import Dict, Any
+import re
+from typing import Dict, Any, NamedTuple, Optional
 from google.adk.agents import Agent
+from google.adk.tools import FunctionTool, ToolContext
+from google.genai import types
 
-# In-memory notepad storage
-notepad_storage = {"notes": ""}
+try:
+    from .console_io import ainput
+except ImportError:
+    # Loaded as a top-level module by the runners in this directory
+    from console_io import ainput
 
-def call_contact(contact_name: str, phone_number: str, purpose: str) -> Dict[str, Any]:
+# Session state key a runner can set to name a conversation; the interactive tools
+# show it so the operator knows which conversation a prompt belongs to
+CONVERSATION_STATE_KEY = "conversation"
+
+# Guards the terminal so one tool's printed details and the replies it reads stay together
+_terminal_lock = None
+_terminal_lock_loop = None
+
+# In-memory notepad storage; appends extend the buffer in place instead of copying it
+notepad_storage = bytearray()
+
+# Keyword patterns used to infer who a call or email is aimed at, in priority order
+ROLE_PATTERNS = [
+    (re.compile(r"interviewer|interview availability", re.I), "Interviewer"),
+    (re.compile(r"candidate|applicant", re.I), "Candidate"),
+    (re.compile(r"\b(hr|recruiter|recruitment)\b", re.I), "HR/Recruiter"),
+]
+
+def classify_role(text: str, default: str) -> str:
+    """Return the first role whose keywords appear in text, or default."""
+    return next((label for pattern, label in ROLE_PATTERNS if pattern.search(text)), default)
+
+# Fixed-shape tool results; converted with _asdict() where ADK needs a dict
+class CallResult(NamedTuple):
+    status: str
+    contact_name: str
+    contact_role: str
+    phone_number: str
+    discussion_summary: str
+    duration_minutes: int
+    next_steps: str
+
+class ScheduleResult(NamedTuple):
+    status: str
+    candidate_name: str
+    scheduled_date: str
+    scheduled_time: str
+    duration_minutes: int
+    interview_type: str
+    confirmation: str
+    meeting_id: str
+
+class EmailResult(NamedTuple):
+    status: str
+    recipient_email: str
+    recipient_role: str
+    subject: str
+    message_type: str
+    delivery_confirmation: str
+    recipient_response: str
+    response_time: str
+    sent_at: str
+
+class NotesReadResult(NamedTuple):
+    status: str
+    action: str
+    current_notes: str
+    timestamp: str
+
+class NotesResult(NamedTuple):
+    status: str
+    action: str
+    message: str
+    timestamp: str
+    content: Optional[str] = None
+
+class HumanDecision(NamedTuple):
+    status: str
+    decision: str
+    additional_instructions: str
+    timestamp: str
+
+def is_success(outcome: str, failure_keywords: tuple) -> bool:
+    """Return True if none of the failure keywords appear in the outcome text."""
+    outcome_lower = outcome.lower()
+    return not any(keyword in outcome_lower for keyword in failure_keywords)
+
+@contextlib.asynccontextmanager
+async def tool_prompt(tool_context: Optional[ToolContext]):
+    """Hold the terminal while a tool prints its details and reads the replies.
+
+    Parallel tool calls and concurrent conversations take turns, so every reply
+    is read straight after the prompt it answers.
+    """
+    global _terminal_lock, _terminal_lock_loop
+    loop = asyncio.get_running_loop()
+    # Created per loop; on 3.9 a Lock is bound to the loop it was created on
+    if _terminal_lock_loop is not loop:
+        _terminal_lock, _terminal_lock_loop = asyncio.Lock(), loop
+    async with _terminal_lock:
+        label = tool_context.state.get(CONVERSATION_STATE_KEY) if tool_context is not None else None
+        if label:
+            print(f"\n🗂️ Conversation: {label}")
+        yield
+
+async def call_contact(contact_name: str, phone_number: str, purpose: str, tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """Mock tool to call someone and get user input as the response.
     
     Args:
@@ -16,41 +119,34 @@ def call_contact(contact_name: str, phone_number: str, purpose: str) -> Dict[str
     Returns:
         dict: Call summary based on user input
     """
-    # Extract role from purpose or default to "Contact"
-    role = ""
-    if "interviewer" in purpose.lower():
-        role = "Interviewer"
-    elif "candidate" in purpose.lower():
-        role = "Candidate"
-    elif "hr" in purpose.lower() or "recruiter" in purpose.lower():
-        role = "HR/Recruiter"
-    else:
-        role = "Contact"
+    async with tool_prompt(tool_context):
+        # Extract role from purpose or default to "Contact"
+        role = classify_role(purpose, "Contact")
 
-    print(f"\n📞 Simulating call to {contact_name} ({role})")
-    print(f"Phone: {phone_number}")
-    print(f"Purpose: {purpose}")
-    print(f"\nPlease describe the call outcome with {role}:")
-    
-    outcome = input("> ")
-    
-    # Check if it was a successful call based on keywords
-    success = "no answer" not in outcome.lower() and "failed" not in outcome.lower()
-    
-    result = {
-        "status": "success" if success else "no_answer",
-        "contact_name": contact_name,
-        "contact_role": role,
-        "phone_number": phone_number,
-        "discussion_summary": outcome,
-        "duration_minutes": 5 if success else 0,
-        "next_steps": "Follow up via email" if not success else "Proceed with scheduling"
-    }
-    
-    print(f"\n📞 Call Result with {role}: {outcome}")
-    return result
+        print(f"\n📞 Simulating call to {contact_name} ({role})")
+        print(f"Phone: {phone_number}")
+        print(f"Purpose: {purpose}")
+        print(f"\nPlease describe the call outcome with {role}:")
+        
+        outcome = await ainput()
+        
+        # Check if it was a successful call based on keywords
+        success = is_success(outcome, ("no answer", "failed"))
+        
+        result = CallResult(
+            status="success" if success else "no_answer",
+            contact_name=contact_name,
+            contact_role=role,
+            phone_number=phone_number,
+            discussion_summary=outcome,
+            duration_minutes=5 if success else 0,
+            next_steps="Follow up via email" if not success else "Proceed with scheduling",
+        )
+        
+        print(f"\n📞 Call Result with {role}: {outcome}")
+        return result._asdict()
 
-def schedule_calendar(candidate_name: str, date: str, time: str, duration_minutes: int = 60, interview_type: str = "technical") -> Dict[str, Any]:
+async def schedule_calendar(candidate_name: str, date: str, time: str, duration_minutes: int = 60, interview_type: str = "technical", tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """Mock tool to schedule a calendar appointment with user input.
     
     Args:
@@ -63,31 +159,32 @@ def schedule_calendar(candidate_name: str, date: str, time: str, duration_minute
     Returns:
         dict: Scheduling result based on user input
     """
-    print(f"\n📅 Attempting to schedule: {interview_type} interview")
-    print(f"For: {candidate_name}")
-    print(f"Date: {date} at {time} ({duration_minutes} minutes)")
-    print("\nEnter scheduling result (e.g., confirmed, conflict, alternative time, etc.):")
-    
-    outcome = input("> ")
-    
-    # Check if scheduling was successful based on keywords
-    success = "conflict" not in outcome.lower() and "fail" not in outcome.lower()
-    
-    result = {
-        "status": "success" if success else "conflict",
-        "candidate_name": candidate_name,
-        "scheduled_date": date,
-        "scheduled_time": time,
-        "duration_minutes": duration_minutes,
-        "interview_type": interview_type,
-        "confirmation": outcome,
-        "meeting_id": f"INT_{datetime.datetime.now().strftime('%Y%m%d%H%M')}"
-    }
-    
-    print(f"\n📅 Scheduling Result: {outcome}")
-    return result
+    async with tool_prompt(tool_context):
+        print(f"\n📅 Attempting to schedule: {interview_type} interview")
+        print(f"For: {candidate_name}")
+        print(f"Date: {date} at {time} ({duration_minutes} minutes)")
+        print("\nEnter scheduling result (e.g., confirmed, conflict, alternative time, etc.):")
+        
+        outcome = await ainput()
+        
+        # Check if scheduling was successful based on keywords
+        success = is_success(outcome, ("conflict", "fail"))
+        
+        result = ScheduleResult(
+            status="success" if success else "conflict",
+            candidate_name=candidate_name,
+            scheduled_date=date,
+            scheduled_time=time,
+            duration_minutes=duration_minutes,
+            interview_type=interview_type,
+            confirmation=outcome,
+            meeting_id=f"INT_{datetime.datetime.now().strftime('%Y%m%d%H%M')}",
+        )
+        
+        print(f"\n📅 Scheduling Result: {outcome}")
+        return result._asdict()
 
-def send_email(recipient_email: str, subject: str, message_type: str, additional_details: str = "") -> Dict[str, Any]:
+async def send_email(recipient_email: str, subject: str, message_type: str, additional_details: str = "", tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """Mock tool to send emails and get immediate simulated response.
     
     Args:
@@ -99,63 +196,57 @@ def send_email(recipient_email: str, subject: str, message_type: str, additional
     Returns:
         dict: Email sending result and recipient's response
     """
-    # Extract role from message_type or subject
-    role = ""
-    if any(word in message_type.lower() or word in subject.lower() for word in ["interviewer", "interview availability"]):
-        role = "Interviewer"
-    elif any(word in message_type.lower() or word in subject.lower() for word in ["candidate", "applicant"]):
-        role = "Candidate"
-    elif any(word in message_type.lower() or word in subject.lower() for word in ["hr", "recruiter", "recruitment"]):
-        role = "HR/Recruiter"
-    else:
-        role = "Recipient"
+    async with tool_prompt(tool_context):
+        # Extract role from message_type or subject
+        role = classify_role(message_type + " " + subject, "Recipient")
 
-    print(f"\n📧 Sending {message_type} email")
-    print(f"To: {recipient_email} ({role})")
-    print(f"Subject: {subject}")
-    print(f"Additional Details: {additional_details}")
-    print("\nEnter email sending result:")
-    
-    outcome = input("> ")
-    
-    # If email was delivered successfully, get the simulated response
-    if "fail" not in outcome.lower() and "error" not in outcome.lower():
-        print(f"\n📨 Simulate {role}'s response to this email:")
-        print("(Enter their reply or press Enter for no response)")
-        email_response = input("> ")
+        print(f"\n📧 Sending {message_type} email")
+        print(f"To: {recipient_email} ({role})")
+        print(f"Subject: {subject}")
+        print(f"Additional Details: {additional_details}")
+        print("\nEnter email sending result:")
         
-        # If they provided a response, get response time
-        if email_response.strip():
-            print(f"\nHow long did {role} take to respond? (e.g., '5 minutes', '2 hours', etc.)")
-            response_time = input("> ")
+        outcome = await ainput()
+        
+        # If email was delivered successfully, get the simulated response
+        delivered = is_success(outcome, ("fail", "error"))
+        if delivered:
+            print(f"\n📨 Simulate {role}'s response to this email:")
+            print("(Enter their reply or press Enter for no response)")
+            email_response = await ainput()
+            
+            # If they provided a response, get response time
+            if email_response.strip():
+                print(f"\nHow long did {role} take to respond? (e.g., '5 minutes', '2 hours', etc.)")
+                response_time = await ainput()
+            else:
+                email_response = "No response received"
+                response_time = "N/A"
         else:
-            email_response = "No response received"
+            email_response = "Email not delivered"
             response_time = "N/A"
-    else:
-        email_response = "Email not delivered"
-        response_time = "N/A"
-    
-    result = {
-        "status": "success" if "fail" not in outcome.lower() and "error" not in outcome.lower() else "failed",
-        "recipient_email": recipient_email,
-        "recipient_role": role,
-        "subject": subject,
-        "message_type": message_type,
-        "delivery_confirmation": outcome,
-        "recipient_response": email_response,
-        "response_time": response_time,
-        "sent_at": datetime.datetime.now().isoformat()
-    }
-    
-    print(f"\n📧 Email Result to {role}: {outcome}")
-    if result["status"] == "success":
-        print(f"📨 {role}'s Response: {email_response}")
-        if response_time != "N/A":
-            print(f"⏱️ Response Time: {response_time}")
-    
-    return result
+        
+        result = EmailResult(
+            status="success" if delivered else "failed",
+            recipient_email=recipient_email,
+            recipient_role=role,
+            subject=subject,
+            message_type=message_type,
+            delivery_confirmation=outcome,
+            recipient_response=email_response,
+            response_time=response_time,
+            sent_at=datetime.datetime.now().isoformat(),
+        )
+        
+        print(f"\n📧 Email Result to {role}: {outcome}")
+        if result.status == "success":
+            print(f"📨 {role}'s Response: {email_response}")
+            if response_time != "N/A":
+                print(f"⏱️ Response Time: {response_time}")
+        
+        return result._asdict()
 
-def manage_notes(action: str, content: str = "") -> Dict[str, Any]:
+async def manage_notes(action: str, content: str = "", tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """Mock notepad tool with user input for verification.
     
     Args:
@@ -165,37 +256,44 @@ def manage_notes(action: str, content: str = "") -> Dict[str, Any]:
     Returns:
         dict: Result of the notepad operation
     """
-    print(f"\n📝 Notes Operation: {action}")
-    if content:
-        print(f"Content: {content}")
-    
-    if action == "read":
-        print("\nEnter current notes content for testing:")
-        notes = input("> ")
-        return {
-            "status": "success",
-            "action": "read",
-            "current_notes": notes,
-            "timestamp": datetime.datetime.now().isoformat()
-        }
-    
-    print("\nEnter result of notes operation (e.g., saved, failed, etc.):")
-    outcome = input("> ")
-    
-    result = {
-        "status": "success" if "fail" not in outcome.lower() else "error",
-        "action": action,
-        "message": outcome,
-        "timestamp": datetime.datetime.now().isoformat()
-    }
-    
-    if action in ["write", "append"]:
-        result["content"] = content
-    
-    print(f"\n📝 Notes Result: {outcome}")
-    return result
+    async with tool_prompt(tool_context):
+        print(f"\n📝 Notes Operation: {action}")
+        if content:
+            print(f"Content: {content}")
+        
+        if action == "read":
+            print("\nEnter current notes content for testing (press Enter to use saved notes):")
+            notes = await ainput() or notepad_storage.decode("utf-8")
+            return NotesReadResult(
+                status="success",
+                action="read",
+                current_notes=notes,
+                timestamp=datetime.datetime.now().isoformat(),
+            )._asdict()
+        
+        print("\nEnter result of notes operation (e.g., saved, failed, etc.):")
+        outcome = await ainput()
+        
+        is_edit = action in ["write", "append"]
+        result = NotesResult(
+            status="success" if is_success(outcome, ("fail",)) else "error",
+            action=action,
+            message=outcome,
+            timestamp=datetime.datetime.now().isoformat(),
+            content=content if is_edit else None,
+        )
+        
+        if is_edit and result.status == "success":
+            if action == "write":
+                notepad_storage.clear()
+            elif notepad_storage:
+                notepad_storage.extend(b"\n")
+            notepad_storage.extend(content.encode("utf-8"))
+        
+        print(f"\n📝 Notes Result: {outcome}")
+        return result._asdict()
 
-def human_in_loop(situation: str, context: str, suggested_actions: str = "") -> Dict[str, Any]:
+async def human_in_loop(situation: str, context: str, suggested_actions: str = "", tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
     """Function for human intervention in conflict resolution.
     
     Args:
@@ -206,32 +304,50 @@ def human_in_loop(situation: str, context: str, suggested_actions: str = "") ->
     Returns:
         dict: Human decision and any additional instructions
     """
-    print("\n🤝 Human Intervention Needed")
-    print("=" * 50)
-    print(f"Situation: {situation}")
-    print(f"Context: {context}")
-    if suggested_actions:
-        print(f"Suggested Actions: {suggested_actions}")
-    
-    print("\nPlease provide your decision/guidance:")
-    decision = input("> ")
-    
-    # Get any additional instructions if needed
-    print("\nAny additional instructions? (Press Enter if none)")
-    additional_instructions = input("> ")
-    
-    result = {
-        "status": "resolved" if "cancel" not in decision.lower() else "cancelled",
-        "decision": decision,
-        "additional_instructions": additional_instructions if additional_instructions else "None",
-        "timestamp": datetime.datetime.now().isoformat()
-    }
-    
-    print(f"\n🤝 Human Decision: {decision}")
-    if additional_instructions:
-        print(f"Additional Instructions: {additional_instructions}")
-    
-    return result
+    async with tool_prompt(tool_context):
+        print("\n🤝 Human Intervention Needed")
+        print("=" * 50)
+        print(f"Situation: {situation}")
+        print(f"Context: {context}")
+        if suggested_actions:
+            print(f"Suggested Actions: {suggested_actions}")
+        
+        print("\nPlease provide your decision/guidance:")
+        decision = await ainput()
+        
+        # Get any additional instructions if needed
+        print("\nAny additional instructions? (Press Enter if none)")
+        additional_instructions = await ainput()
+        
+        result = HumanDecision(
+            status="resolved" if is_success(decision, ("cancel",)) else "cancelled",
+            decision=decision,
+            additional_instructions=additional_instructions if additional_instructions else "None",
+            timestamp=datetime.datetime.now().isoformat(),
+        )
+        
+        print(f"\n🤝 Human Decision: {decision}")
+        if additional_instructions:
+            print(f"Additional Instructions: {additional_instructions}")
+        
+        return result._asdict()
+
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool that builds its schema once instead of on every model request.
+
+    FunctionTool re-inspects the wrapped function's signature and docstring each
+    time the tool is offered to the model; the declaration never changes, so it
+    is built on first use and reused afterwards.
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+        self._declaration = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        if self._declaration is None:
+            self._declaration = super()._get_declaration()
+        return self._declaration
 
 # Create the interview scheduling agent
 root_agent = Agent(
@@ -264,7 +380,11 @@ root_agent = Agent(
         "Always be professional and organized. Consider time zones and "
         "scheduling constraints. For any uncertainty or conflicts, always escalate to the recruiter - "
         "call first, then email if no response. Make sure to use the tools to the best of your ability "
-        "and to not make up information."
+        "and to not make up information.\n\n"
+        "When several tool calls in the same step do not depend on each other (for example emailing "
+        "both the interviewer and the candidate), emit all of them together in one response rather "
+        "than waiting for each result before making the next call. Each call is handled on its own, "
+        "so one failed contact does not affect the others."
     ),
-    tools=[call_contact, schedule_calendar, send_email],
+    tools=[CachedFunctionTool(tool) for tool in (call_contact, schedule_calendar, send_email)],
 ) 
\ No newline at end of file
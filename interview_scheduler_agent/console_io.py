@@ -0,0 +1,142 @@
+"""Terminal input for the interactive tools and runners.
+
+ainput() reads stdin without blocking the event loop, and Ctrl-C while it
+waits raises KeyboardInterrupt in the awaiting coroutine. on_interrupt() lets
+a runner cancel other work, such as an agent turn, on Ctrl-C instead.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import os
+import queue
+import signal
+import sys
+import threading
+from typing import NamedTuple, Optional
+
+# Prompts are answered one at a time, so a single long-lived thread serves every input() call.
+# It is a daemon thread: a read still blocked when the program exits must not hold up shutdown.
+_input_requests = queue.SimpleQueue()
+_input_thread = None
+_input_thread_lock = threading.Lock()
+# The request the stdin thread is blocked on, if any
+_input_reading = None
+# Whether an on_interrupt() block currently owns Ctrl-C
+_interrupt_owned = False
+
+class _InputRequest(NamedTuple):
+    prompt: str
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    # Set when the awaiting coroutine gave up on the line (Ctrl-C or cancellation)
+    abandoned: threading.Event
+
+def _read_stdin_forever():
+    """Serve ainput() requests in order, handing each line back to the waiting loop.
+
+    A line typed for a read that was abandoned in the meantime goes to the
+    next request instead of being lost.
+    """
+    global _input_reading
+    leftover = None
+    while True:
+        request = _input_requests.get()
+        if request.abandoned.is_set():
+            continue
+        if leftover is not None:
+            (line, error), leftover = leftover, None
+        else:
+            _input_reading = request
+            try:
+                line, error = input(request.prompt), None
+            except Exception as exc:
+                line, error = None, exc
+            _input_reading = None
+        if request.abandoned.is_set():
+            leftover = (line, error)
+            continue
+        try:
+            request.loop.call_soon_threadsafe(_deliver_input, request.future, line, error)
+        except RuntimeError:
+            # The loop has closed; nobody is waiting for this line any more
+            pass
+
+@atexit.register
+def _exit_if_stdin_blocked():
+    # An abandoned read leaves the stdin thread blocked inside input(), which on a
+    # pipe holds stdin's lock; finalizing the interpreter around it aborts the
+    # process, so leave now with the usual status for an interrupted program
+    request = _input_reading
+    if request is not None and request.abandoned.is_set():
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(130)
+
+def _deliver_input(future: asyncio.Future, line: Optional[str], error: Optional[Exception]):
+    # A read abandoned with Ctrl-C has already been resolved
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(line)
+
+@contextlib.contextmanager
+def on_interrupt(callback, *args):
+    """Call callback(*args) on the running loop for Ctrl-C inside the block.
+
+    An enclosing block keeps Ctrl-C, so a read inside an agent turn is
+    cancelled with the turn rather than interrupted on its own. The SIGINT
+    handler that was there before (asyncio.run has its own on 3.11+) is put
+    back afterwards. Where the loop cannot take signal handlers (Windows, or
+    not the main thread) Ctrl-C behaves as usual.
+    """
+    global _interrupt_owned
+    if _interrupt_owned:
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, callback, *args)
+        installed = True
+    except (NotImplementedError, RuntimeError, ValueError):
+        installed = False
+    _interrupt_owned = installed
+    try:
+        yield
+    finally:
+        if installed:
+            _interrupt_owned = False
+            loop.remove_signal_handler(signal.SIGINT)
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+
+def _interrupt_input(future: asyncio.Future):
+    if not future.done():
+        future.set_exception(KeyboardInterrupt())
+
+async def ainput(prompt: str = "> ") -> str:
+    """Read a line from stdin in a worker thread so the event loop keeps running.
+
+    Ctrl-C while waiting raises KeyboardInterrupt in the awaiting coroutine, as
+    input() would; EOF raises EOFError.
+    """
+    global _input_thread
+    with _input_thread_lock:
+        if _input_thread is None:
+            _input_thread = threading.Thread(target=_read_stdin_forever, name="stdin", daemon=True)
+            _input_thread.start()
+    
+    loop = asyncio.get_running_loop()
+    request = _InputRequest(prompt, loop, loop.create_future(), threading.Event())
+    _input_requests.put(request)
+    
+    try:
+        with on_interrupt(_interrupt_input, request.future):
+            return await request.future
+    except BaseException:
+        # Interrupted or cancelled; the stdin thread passes the line it reads on
+        request.abandoned.set()
+        raise
@@ -4,22 +4,103 @@ Contact-Based Interview Scheduler Runner
 Initializes the interview scheduling agent with specific contact details.
 """
 
+import argparse
 import asyncio
+import collections
+import functools
+import logging
 import sys
 import random
+import string
 from dataclasses import dataclass
-from typing import Optional, List
-from agent import root_agent
-from dotenv import load_dotenv
-from google.adk.cli.utils import logs
-from google.adk.runners import Runner
-from google.adk.sessions import DatabaseSessionService
-from google.genai import types
-
-load_dotenv(override=True)
-logs.log_to_tmp_folder()
-
-@dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Optional, List
+
+from console_io import ainput, on_interrupt
+
+# The agent, runner and genai modules are imported where they are first used,
+# so commands like --list don't pay for loading them
+if TYPE_CHECKING:
+    from google.adk.sessions import DatabaseSessionService
+    from google.genai import types
+
+_bootstrapped = False
+
+def bootstrap():
+    """Load .env and route ADK logs to the tmp folder; safe to call more than once.
+    
+    Kept out of import time so importing this module (e.g. for the MOCK_* data)
+    does no file I/O.
+    """
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    from dotenv import load_dotenv
+    from google.adk.cli.utils import logs
+    
+    load_dotenv(override=True)
+    logs.log_to_tmp_folder()
+    _bootstrapped = True
+
+# Conversation output; formatting is deferred so it costs nothing when the level is raised
+log = logging.getLogger("contact_based_runner")
+
+def configure_output(level: int = logging.INFO):
+    """Send conversation output to stdout as plain text at the given level."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers[:] = [handler]
+    log.setLevel(level)
+    log.propagate = False
+
+@functools.lru_cache(maxsize=None)
+def get_session_service(db_url: str) -> "DatabaseSessionService":
+    """Return the session service for db_url, shared by every runner in the process.
+    
+    Sharing it means one SQLAlchemy engine, and so one connection pool, per
+    database. The pinned google-adk (1.0.0) takes only db_url, so the engine
+    keeps SQLAlchemy's default pool for the URL.
+    """
+    from google.adk.sessions import DatabaseSessionService
+    
+    return DatabaseSessionService(db_url=db_url)
+
+def user_content(text: str) -> "types.Content":
+    """Wrap text as a user turn, constructing the Part directly instead of via Part.from_text."""
+    from google.genai import types
+    
+    return types.Content(role='user', parts=[types.Part(text=text)])
+
+INIT_CONTEXT_TEMPLATE = """
+INTERVIEW COORDINATION SETUP:
+=================================
+
+Company: {company}
+Position: {position}
+Interview Type: {interview_type}
+Duration: {preferred_duration} minutes
+
+HR CONTACT:
+- Name: {hr_contact.name}
+- Email: {hr_contact.email}
+- Phone: {hr_contact.phone}
+- Role: {hr_contact.role}
+
+INTERVIEWER:
+- Name: {interviewer.name} 
+- Email: {interviewer.email}
+- Phone: {interviewer.phone}
+- Role: {interviewer.role}
+
+CANDIDATE TO SCHEDULE:
+- Name: {interviewee.name}
+- Email: {interviewee.email}
+- Phone: {interviewee.phone}
+- Applying for: {position}
+
+You are now ready to coordinate this interview. Start by reviewing this information and let me know your next steps.
+"""
+
+@dataclass(frozen=True)
 class ContactInfo:
     """Contact information structure."""
     name: str
@@ -29,9 +110,14 @@ class ContactInfo:
     company: str = "TechCorp Inc."
     
     def __str__(self):
+        return self.display
+    
+    @functools.cached_property
+    def display(self) -> str:
+        """Rendered contact line, built on first use and reused afterwards."""
         return f"{self.name} ({self.role}) - {self.email}, {self.phone} @ {self.company}"
 
-@dataclass
+@dataclass(frozen=True)
 class InterviewSetup:
     """Complete interview setup with all participants."""
     hr_contact: ContactInfo
@@ -44,160 +130,204 @@ class InterviewSetup:
     
     def get_initialization_context(self) -> str:
         """Generate initialization context for the agent."""
-        return f"""
-INTERVIEW COORDINATION SETUP:
-=================================
-
-Company: {self.company}
-Position: {self.position}
-Interview Type: {self.interview_type}
-Duration: {self.preferred_duration} minutes
-
-HR CONTACT:
-- Name: {self.hr_contact.name}
-- Email: {self.hr_contact.email}
-- Phone: {self.hr_contact.phone}
-- Role: {self.hr_contact.role}
-
-INTERVIEWER:
-- Name: {self.interviewer.name} 
-- Email: {self.interviewer.email}
-- Phone: {self.interviewer.phone}
-- Role: {self.interviewer.role}
+        return self.initialization_context
+    
+    @functools.cached_property
+    def initialization_context(self) -> str:
+        """Initialization context, rendered on first use and reused afterwards."""
+        return INIT_CONTEXT_TEMPLATE.format_map(vars(self))
 
-CANDIDATE TO SCHEDULE:
-- Name: {self.interviewee.name}
-- Email: {self.interviewee.email}
-- Phone: {self.interviewee.phone}
-- Applying for: {self.position}
+# Spaces to underscores and ASCII letters to lowercase in a single translate pass
+SLUG_TABLE = str.maketrans({" ": "_", **{c: c.lower() for c in string.ascii_uppercase}})
 
-You are now ready to coordinate this interview. Start by reviewing this information and let me know your next steps.
-"""
+def slugify(name: str) -> str:
+    """Return name with spaces replaced by underscores, lowercased."""
+    if name.isascii():
+        return name.translate(SLUG_TABLE)
+    # Non-ASCII names need full Unicode lowercasing
+    return name.replace(" ", "_").lower()
 
 class ContactBasedRunner:
     """Runner that manages interview scheduling with specific contacts."""
     
-    def __init__(self, interview_setup: InterviewSetup, db_url: str = "sqlite:///./interview_scheduler.db"):
+    def __init__(self, interview_setup: InterviewSetup, db_url: str = "sqlite:///./interview_scheduler.db", rate_limit_delay: float = 0.0):
+        # Used as a library, output still goes to stdout unless the caller configured it
+        if not log.handlers:
+            configure_output()
         self.setup = interview_setup
         self.runner = None
         self.session = None
         self.db_url = db_url
+        # Seconds to wait before each agent turn, to stay under provider rate limits
+        self.rate_limit_delay = rate_limit_delay
+        self.app_name = sys.intern(f'interview_coordination_{slugify(interview_setup.interviewee.name)}')
+        self.user_id = sys.intern(f'hr_{slugify(interview_setup.hr_contact.name)}')
+        self.init_context = None
         
     async def initialize(self):
         """Initialize the ADK runner and session."""
-        app_name = f'interview_coordination_{self.setup.interviewee.name.replace(" ", "_").lower()}'
-        user_id = f'hr_{self.setup.hr_contact.name.replace(" ", "_").lower()}'
+        await self.create_session()
         
-        # Create a DatabaseSessionService
-        session_service = DatabaseSessionService(db_url=self.db_url)
+        # Initialize the agent with contact information
+        await self._send_initialization_message()
+    
+    async def create_session(self):
+        """Create the ADK runner and its session without contacting the agent.
+        
+        The session is labelled with the candidate and position, so the
+        interactive tools can say which conversation a prompt belongs to when
+        several scenarios run at once.
+        """
+        from agent import CONVERSATION_STATE_KEY, root_agent
+        from google.adk.runners import Runner
         
+        bootstrap()
         self.runner = Runner(
             agent=root_agent,
-            app_name=app_name,
-            session_service=session_service  # Use the database session service
+            app_name=self.app_name,
+            session_service=get_session_service(self.db_url)  # Use the shared database session service
         )
         
         self.session = await self.runner.session_service.create_session(
-            app_name=app_name, user_id=user_id
+            app_name=self.app_name,
+            user_id=self.user_id,
+            state={CONVERSATION_STATE_KEY: f"{self.setup.interviewee.name} ({self.setup.position})"},
         )
-        
-        # Initialize the agent with contact information
-        await self._send_initialization_message()
+        self.init_context = self.setup.get_initialization_context()
         
     async def _send_initialization_message(self):
         """Send the initialization context to the agent."""
-        print("🚀 [INITIALIZATION] Setting up interview coordination context...")
-        print("=" * 60)
+        log.info("🚀 [INITIALIZATION] Setting up interview coordination context...\n%s", "=" * 60)
         
-        content = types.Content(
-            role='user', 
-            parts=[types.Part.from_text(text=self.setup.get_initialization_context())]
-        )
-        
-        async for event in self.runner.run_async(
-            user_id=f'hr_{self.setup.hr_contact.name.replace(" ", "_").lower()}',
-            session_id=self.session.id,
-            new_message=content,
-        ):
-            if event.content.parts and event.content.parts[0].text:
-                print(f"🤖 Agent: {event.content.parts[0].text}")
+        await self._stream_response(user_content(self.init_context))
         
-        print("=" * 60)
+        log.info("%s", "=" * 60)
         
     async def send_message(self, message: str):
         """Send a message to the agent."""
-        content = types.Content(
-            role='user', 
-            parts=[types.Part.from_text(text=message)]
-        )
-        
-        print(f"\n👤 HR ({self.setup.hr_contact.name}): {message}")
-        print("-" * 40)
+        log.info("\n👤 HR (%s): %s\n%s", self.setup.hr_contact.name, message, "-" * 40)
         
+        await self._stream_response(user_content(message))
+    
+    async def iter_message(self, message: str) -> AsyncIterator[str]:
+        """Send a message to the agent and yield its text as it arrives, without printing."""
+        async for text in self._iter_response(user_content(message)):
+            yield text
+    
+    async def _iter_response(self, content: "types.Content") -> AsyncIterator[str]:
+        """Run one agent turn and yield the text of each event."""
+        if self.rate_limit_delay:
+            await asyncio.sleep(self.rate_limit_delay)
         async for event in self.runner.run_async(
-            user_id=f'hr_{self.setup.hr_contact.name.replace(" ", "_").lower()}',
+            user_id=self.user_id,
             session_id=self.session.id,
             new_message=content,
         ):
             if event.content.parts and event.content.parts[0].text:
-                print(f"🤖 Agent: {event.content.parts[0].text}")
+                yield event.content.parts[0].text
+    
+    async def _stream_response(self, content: "types.Content"):
+        """Run one agent turn, logging its text as it arrives.
+        
+        Each chunk is written before the next event is handled, so what the
+        agent says before a tool call appears ahead of that tool's own prompt.
+        """
+        async for text in self._iter_response(content):
+            log.info("🤖 Agent: %s", text)
     
     async def run_predefined_scenario(self):
         """Run a predefined scenario with the loaded contacts."""
-        print(f"\n🎬 [SCENARIO] Starting interview coordination for {self.setup.position} position")
+        log.info("\n🎬 [SCENARIO] Starting interview coordination for %s position", self.setup.position)
         
-        # Step 1: Initial coordination request
+        # All three steps go out as one request so the agent can work through
+        # them in a single turn instead of three full prompt round trips
         await self.send_message(
-            f"Please start coordinating the interview for {self.setup.interviewee.name}. "
+            "Please work through the following steps in order and report back with one section per step "
+            "(Step 1, Step 2, Step 3):\n"
+            f"1. Start coordinating the interview for {self.setup.interviewee.name}. "
             f"We need to schedule a {self.setup.interview_type} interview for the {self.setup.position} position. "
-            f"The interviewer is {self.setup.interviewer.name}. Please reach out to the candidate first to check their availability."
-        )
-        
-        # Step 2: Follow up on scheduling
-        await self.send_message(
-            "Great! Once you have the candidate's availability, please try to schedule the interview and send confirmation emails to all parties."
-        )
-        
-        # Step 3: Check progress
-        await self.send_message(
-            "Can you provide me with a summary of the current status and what still needs to be done?"
+            f"The interviewer is {self.setup.interviewer.name}. Reach out to the candidate first to check their availability.\n"
+            "2. Once you have the candidate's availability, schedule the interview and send confirmation emails to all parties.\n"
+            "3. Finish with a summary of the current status and what still needs to be done."
         )
     
+    async def _run_turn(self, turn) -> bool:
+        """Await one agent turn, cancelling it on Ctrl-C; return whether it finished."""
+        task = asyncio.ensure_future(turn)
+        with on_interrupt(task.cancel):
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+        if task.cancelled():
+            return False
+        task.result()
+        return True
+    
     async def run_interactive_mode(self):
-        """Run in interactive mode allowing custom messages."""
+        """Run in interactive mode allowing custom messages.
+        
+        Ctrl-C at the prompt, or while the agent is answering, ends the session.
+        """
         print(f"\n💬 [INTERACTIVE MODE] You can now send custom messages to coordinate the interview")
         print(f"Type 'quit' to exit, 'status' for current progress, 'scenario' to run predefined scenario")
         print("-" * 60)
         
         while True:
             try:
-                user_input = input(f"\n👤 {self.setup.hr_contact.name}: ")
+                user_input = await ainput(f"\n👤 {self.setup.hr_contact.name}: ")
                 
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     print(f"\n👋 Interview coordination session ended.")
                     break
                     
                 if user_input.lower() == 'status':
-                    await self.send_message("Please provide a detailed status update of all interview coordination activities.")
-                    continue
-                    
-                if user_input.lower() == 'scenario':
-                    await self.run_predefined_scenario()
-                    continue
-                    
-                if not user_input.strip():
+                    turn = self.send_message("Please provide a detailed status update of all interview coordination activities.")
+                elif user_input.lower() == 'scenario':
+                    turn = self.run_predefined_scenario()
+                elif not user_input.strip():
                     continue
-                    
-                await self.send_message(user_input)
+                else:
+                    turn = self.send_message(user_input)
+                
+                if not await self._run_turn(turn):
+                    raise KeyboardInterrupt
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print(f"\n\n👋 Interview coordination session ended.")
                 break
             except Exception as e:
                 print(f"\n❌ Error: {e}")
 
+async def run_many_scenarios(setups: List[InterviewSetup], concurrency: int = 4, db_url: Optional[str] = None, rate_limit_delay: float = 0.0) -> list:
+    """Run the predefined scenario for many setups at once.
+    
+    At most `concurrency` scenarios talk to the agent at the same time. Failures
+    are returned in place of that scenario's result instead of cancelling the rest.
+    The agent's tools still ask for results on stdin; they take turns and each
+    prompt names the conversation it belongs to (see create_session).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    runner_kwargs = {"db_url": db_url} if db_url else {}
+    runners = [ContactBasedRunner(setup, rate_limit_delay=rate_limit_delay, **runner_kwargs) for setup in setups]
+    
+    # Sessions only touch the database, so they are all created up front and
+    # the semaphore limits just the agent conversations
+    sessions = await asyncio.gather(*(runner.create_session() for runner in runners), return_exceptions=True)
+    
+    async def run_one(runner: ContactBasedRunner, session_error):
+        if isinstance(session_error, Exception):
+            return session_error
+        async with semaphore:
+            await runner._send_initialization_message()
+            await runner.run_predefined_scenario()
+            return runner
+    
+    return await asyncio.gather(*(run_one(*pair) for pair in zip(runners, sessions)), return_exceptions=True)
+
 # Mock HR data for different scenarios
-MOCK_HR_CONTACTS = [
+MOCK_HR_CONTACTS = (
     ContactInfo(
         name="Jennifer Martinez",
         email="j.martinez@techcorp.com", 
@@ -233,9 +363,9 @@ MOCK_HR_CONTACTS = [
         role="People Operations Manager",
         company="FinTech Pro"
     )
-]
+)
 
-MOCK_INTERVIEWERS = [
+MOCK_INTERVIEWERS = (
     ContactInfo(
         name="Alex Kim",
         email="a.kim@techcorp.com",
@@ -271,9 +401,16 @@ MOCK_INTERVIEWERS = [
         role="Staff Software Engineer",
         company="FinTech Pro"
     )
-]
+)
+
+# Interviewers grouped by company, built once so setups don't rescan the list
+_by_company = collections.defaultdict(list)
+for _interviewer in MOCK_INTERVIEWERS:
+    _by_company[_interviewer.company].append(_interviewer)
+INTERVIEWERS_BY_COMPANY = {company: tuple(group) for company, group in _by_company.items()}
+del _by_company, _interviewer
 
-MOCK_CANDIDATES = [
+MOCK_CANDIDATES = (
     ContactInfo(
         name="Sarah Johnson",
         email="sarah.johnson@email.com",
@@ -309,9 +446,9 @@ MOCK_CANDIDATES = [
         role="Data Scientist Candidate",
         company="External"
     )
-]
+)
 
-MOCK_POSITIONS = [
+MOCK_POSITIONS = (
     "Senior Frontend Developer",
     "Backend Software Engineer", 
     "Full Stack Developer",
@@ -322,7 +459,7 @@ MOCK_POSITIONS = [
     "Product Manager",
     "Engineering Manager",
     "Cloud Architect"
-]
+)
 
 def create_sample_setup() -> InterviewSetup:
     """Create a sample interview setup for demonstration."""
@@ -336,20 +473,27 @@ def create_sample_setup() -> InterviewSetup:
         company="TechCorp Inc."
     )
 
-def create_random_setup() -> InterviewSetup:
-    """Create a random interview setup with mock data."""
-    hr = random.choice(MOCK_HR_CONTACTS)
-    interviewer = random.choice([i for i in MOCK_INTERVIEWERS if i.company == hr.company])
-    candidate = random.choice(MOCK_CANDIDATES)
-    position = random.choice(MOCK_POSITIONS)
+# Private generator used when no rng is passed; pass a seeded random.Random for reproducible setups
+_rng = random.Random()
+
+INTERVIEW_TYPES = ("technical", "behavioral", "system design", "cultural fit")
+INTERVIEW_DURATIONS = (45, 60, 90, 120)
+
+def create_random_setup(rng: Optional[random.Random] = None) -> InterviewSetup:
+    """Create a random interview setup with mock data, drawing from rng if given."""
+    rng = rng or _rng
+    hr = rng.choice(MOCK_HR_CONTACTS)
+    interviewer = rng.choice(INTERVIEWERS_BY_COMPANY.get(hr.company) or MOCK_INTERVIEWERS)
+    candidate = rng.choice(MOCK_CANDIDATES)
+    position = rng.choice(MOCK_POSITIONS)
     
     return InterviewSetup(
         hr_contact=hr,
         interviewer=interviewer,
         interviewee=candidate,
         position=position,
-        interview_type=random.choice(["technical", "behavioral", "system design", "cultural fit"]),
-        preferred_duration=random.choice([45, 60, 90, 120]),
+        interview_type=rng.choice(INTERVIEW_TYPES),
+        preferred_duration=rng.choice(INTERVIEW_DURATIONS),
         company=hr.company
     )
 
@@ -363,18 +507,19 @@ def list_available_setups():
         print(f"   Email: {hr.email} | Phone: {hr.phone}")
         print()
 
-def create_custom_setup(hr_index: int) -> InterviewSetup:
+def create_custom_setup(hr_index: int, rng: Optional[random.Random] = None) -> InterviewSetup:
     """Create a setup with a specific HR contact."""
     if hr_index < 1 or hr_index > len(MOCK_HR_CONTACTS):
         raise ValueError("Invalid HR contact index")
     
     hr = MOCK_HR_CONTACTS[hr_index - 1]
     # Find interviewer from same company
-    company_interviewers = [i for i in MOCK_INTERVIEWERS if i.company == hr.company]
+    company_interviewers = INTERVIEWERS_BY_COMPANY.get(hr.company)
     interviewer = company_interviewers[0] if company_interviewers else MOCK_INTERVIEWERS[0]
     
-    candidate = random.choice(MOCK_CANDIDATES)
-    position = random.choice(MOCK_POSITIONS)
+    rng = rng or _rng
+    candidate = rng.choice(MOCK_CANDIDATES)
+    position = rng.choice(MOCK_POSITIONS)
     
     return InterviewSetup(
         hr_contact=hr,
@@ -424,37 +569,62 @@ def get_contacts_from_input() -> InterviewSetup:
         company=hr_company
     )
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Contact-based interview scheduler. Without a setup option you are prompted to choose one.")
+    setup_group = parser.add_mutually_exclusive_group()
+    setup_group.add_argument("--sample", action="store_true", help="use the default sample contact details")
+    setup_group.add_argument("--random", action="store_true", help="use random mock contact details")
+    setup_group.add_argument("--list", action="store_true", help="list the available mock HR contacts and exit")
+    setup_group.add_argument("--batch", type=positive_int, metavar="N", help="run the predefined scenario for N random setups")
+    parser.add_argument("--db-url", help="database URL for session storage")
+    parser.add_argument("--rate-limit-delay", type=float, default=0.0, metavar="SECONDS", help="wait before each agent turn to stay under rate limits")
+    parser.add_argument("--seed", type=int, help="seed for random setups, to reproduce a run")
+    return parser.parse_args()
+
 async def main():
     """Main entry point."""
+    args = parse_args()
+    # Batch runs only report the summary, so per-message output is skipped entirely
+    configure_output(logging.WARNING if args.batch else logging.INFO)
+    
     print("🎯 Contact-Based Interview Scheduler")
     print("=" * 40)
     
-    # Parse command line arguments
-    db_url = None
-    remaining_args = []
-    i = 1
-    while i < len(sys.argv):
-        if sys.argv[i] == "--db-url" and i + 1 < len(sys.argv):
-            db_url = sys.argv[i + 1]
-            i += 2
-        else:
-            remaining_args.append(sys.argv[i])
-            i += 1
+    rng = random.Random(args.seed) if args.seed is not None else None
     
-    if len(remaining_args) > 0:
-        if remaining_args[0] == "--sample":
-            print("📝 Using default sample contact details...")
-            setup = create_sample_setup()
-        elif remaining_args[0] == "--random":
-            print("🎲 Using random mock contact details...")
-            setup = create_random_setup()
-        elif remaining_args[0] == "--list":
-            list_available_setups()
-            return
-        else:
-            print("❌ Invalid argument. Use --sample, --random, --list, or no arguments for custom input.")
-            print("Optional: Use --db-url <url> to specify a custom database URL")
-            return
+    if args.list:
+        list_available_setups()
+        return
+    
+    # Only runs that talk to the agent need .env and the ADK log setup
+    bootstrap()
+    
+    if args.batch:
+        print(f"🎲 Running the predefined scenario for {args.batch} random setups...")
+        results = await run_many_scenarios([create_random_setup(rng) for _ in range(args.batch)], db_url=args.db_url, rate_limit_delay=args.rate_limit_delay)
+        failures = [r for r in results if isinstance(r, Exception)]
+        print(f"\n✅ {args.batch - len(failures)}/{args.batch} scenarios completed")
+        for error in failures:
+            print(f"❌ Error: {error}")
+        return
+    
+    if args.sample:
+        print("📝 Using default sample contact details...")
+        setup = create_sample_setup()
+    elif args.random:
+        print("🎲 Using random mock contact details...")
+        setup = create_random_setup(rng)
     else:
         print("Choose setup option:")
         print("1. Default sample setup")
@@ -466,11 +636,11 @@ async def main():
         if choice == "1":
             setup = create_sample_setup()
         elif choice == "2":
-            setup = create_random_setup()
+            setup = create_random_setup(rng)
         elif choice == "3":
             list_available_setups()
             hr_choice = int(input("Select HR contact (1-5): "))
-            setup = create_custom_setup(hr_choice)
+            setup = create_custom_setup(hr_choice, rng)
         else:
             setup = get_contacts_from_input()
     
@@ -482,14 +652,17 @@ async def main():
     print(f"Position: {setup.position}")
     print(f"Interview Type: {setup.interview_type} ({setup.preferred_duration} min)")
     
-    if db_url:
-        print(f"Using database: {db_url}")
-        runner = ContactBasedRunner(setup, db_url=db_url)
+    if args.db_url:
+        print(f"Using database: {args.db_url}")
+        runner = ContactBasedRunner(setup, db_url=args.db_url, rate_limit_delay=args.rate_limit_delay)
     else:
-        runner = ContactBasedRunner(setup)
+        runner = ContactBasedRunner(setup, rate_limit_delay=args.rate_limit_delay)
     
     await runner.initialize()
 
 if __name__ == '__main__':
     print("Starting Contact-Based Interview Scheduler...")
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print(f"\n\n👋 Interview coordination session ended.") 
\ No newline at end of file
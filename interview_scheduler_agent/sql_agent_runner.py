@@ -4,17 +4,164 @@ SQL Agent Runner
 Interactive runner for the PostgreSQL query agent.
 """
 
+import argparse
 import asyncio
+import functools
+import os
 import sys
-from sql_agent import sql_agent
-from dotenv import load_dotenv
-from google.adk.cli.utils import logs
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
+from typing import TYPE_CHECKING
 
-load_dotenv(override=True)
-logs.log_to_tmp_folder()
+from console_io import ainput
+
+# The agent, runner and genai modules are imported where they are first used,
+# so --help and bad arguments are answered without loading them
+if TYPE_CHECKING:
+    from google.genai import types
+
+# Optional faster event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+_bootstrapped = False
+
+def bootstrap():
+    """Load .env and route ADK logs to the tmp folder; safe to call more than once."""
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    from dotenv import load_dotenv
+    from google.adk.cli.utils import logs
+    
+    load_dotenv(override=True)
+    logs.log_to_tmp_folder()
+    _bootstrapped = True
+
+# Read size for piped stdin, so a long scripted or pasted session arrives in a few reads
+STDIN_BUFFER_SIZE = 64 * 1024
+
+def widen_stdin_buffer():
+    """Reopen piped stdin with a STDIN_BUFFER_SIZE read buffer.
+
+    A terminal is left alone: input() only offers line editing on the real
+    console stream, and typed lines are short anyway.
+    """
+    if sys.stdin is None or sys.stdin.isatty():
+        return
+    # closefd=False keeps fd 0 open for sys.__stdin__, which still wraps it
+    sys.stdin = open(
+        sys.stdin.fileno(),
+        buffering=STDIN_BUFFER_SIZE,
+        encoding=sys.stdin.encoding,
+        errors=sys.stdin.errors,
+        closefd=False,
+    )
+
+@functools.lru_cache(maxsize=128)
+def user_content(text: str) -> "types.Content":
+    """Build the user message for text, reusing it when the same text is sent again.
+
+    The runner only reads new_message, so one Content can be shared by every
+    turn that sends the same text.
+    """
+    from google.genai import types
+    
+    return types.Content(role='user', parts=[types.Part.from_text(text=text)])
+
+# Rules printed between sections of the console output
+SECTION_RULE = "=" * 70
+TURN_RULE = "-" * 50
+HELP_RULE = "-" * 70
+TITLE_RULE = "=" * 30
+PROMPT_RULE = "\n" + "=" * 50
+
+# Shown once when interactive mode starts
+INTERACTIVE_HELP = "\n".join((
+    "\n💬 [INTERACTIVE MODE] Ask me anything about the database!",
+    "Examples:",
+    "  - 'Find all customers in the Healthcare industry'",
+    "  - 'Show me API performance metrics for last week'",
+    "  - 'Which documents failed classification?'",
+    "  - 'Optimize this query: SELECT * FROM customer_master'",
+    "Type 'quit' to exit, 'demo' to run sample queries, 'schema' for table info",
+    HELP_RULE,
+))
+
+def _concurrency_from_env(default: int = 5) -> int:
+    """SQL_AGENT_CONCURRENCY as a count of at least 1; an unparseable value keeps the default."""
+    value = os.environ.get("SQL_AGENT_CONCURRENCY", "").strip()
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(f"Ignoring SQL_AGENT_CONCURRENCY={value!r}: not an integer; using {default}")
+        return default
+
+# How many sample queries may talk to the model at once; lower it if the
+# provider starts rate limiting the demo
+SAMPLE_QUERY_CONCURRENCY = _concurrency_from_env()
+
+# Opening message that tells the agent which tables it is working with
+SCHEMA_INIT_MESSAGE = """
+DATABASE SCHEMA LOADED:
+=======================
+
+I have access to a customer data processing pipeline database with 8 main tables:
+
+1. CUSTOMER_MASTER - Main customer information with account details and API keys
+2. CUSTOMER_PREFERENCES - Additional customer configuration and preferences  
+3. API_MASTER - Downstream API definitions and configurations
+4. PIPELINE_MASTER - Abstraction layer over API master with meaningful pipeline names
+5. PIPLELINE_CUSTOMER_CONFIG - Customer-specific pipeline configurations per queue
+6. DI_AUDIT - Audit logs for downstream integration actions and API calls
+7. CASE_MASTER - Main case/file processing table with upload and status information
+8. DOCUMENT_CLASSIFICATION - Individual documents within cases with classification results
+
+Key Relationships:
+- customer_master links to all other tables via customer_id
+- case_master connects to document_classification via case_id
+- pipeline_master connects to api_master via api_id
+- di_audit tracks all downstream actions with full traceability
+
+I'm ready to help you analyze this database! You can:
+- Ask me to find specific data patterns
+- Request complex analytical queries
+- Ask for performance analysis
+- Get help with query optimization
+
+What would you like to explore?
+"""
+
+class _StreamWriter:
+    """Batch streamed agent text into few stdout writes.
+
+    Text is held until flush_threshold characters have piled up, or until a
+    newline arrives when someone is watching the terminal, then written and
+    flushed in one go; flush() writes whatever is left once the response is
+    complete.
+    """
+
+    def __init__(self, flush_threshold: int = 256):
+        self.flush_threshold = flush_threshold
+        self._flush_lines = sys.stdout.isatty()
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text: str):
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.flush_threshold or (self._flush_lines and "\n" in text):
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            sys.stdout.write("".join(self._chunks))
+            self._chunks.clear()
+            self._size = 0
+        sys.stdout.flush()
 
 class SQLAgentRunner:
     """Runner that manages the SQL query agent."""
@@ -22,10 +169,16 @@ class SQLAgentRunner:
     def __init__(self, db_url: str = "sqlite:///./sql_agent.db"):
         self.runner = None
         self.session = None
+        # run_async bound to this runner's user and session, set by initialize()
+        self._run_async = None
         self.db_url = db_url
         
     async def initialize(self, initial_query: str = None):
         """Initialize the ADK runner and session."""
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+        from sql_agent import sql_agent
+        
         app_name = 'sql_query_agent'
         user_id = 'sql_analyst'
         
@@ -41,6 +194,9 @@ class SQLAgentRunner:
         self.session = await self.runner.session_service.create_session(
             app_name=app_name, user_id=user_id
         )
+        self._run_async = functools.partial(
+            self.runner.run_async, user_id=user_id, session_id=self.session.id
+        )
         
         # Initialize the agent with database schema information or user query
         if initial_query:
@@ -52,74 +208,37 @@ class SQLAgentRunner:
         """Send the initialization context or natural language query to the agent."""
         if natural_language_query:
             print("🚀 [QUERY] Processing natural language query...")
-            print("=" * 70)
-            message = natural_language_query
+            print(SECTION_RULE)
+            content = user_content(natural_language_query)
         else:
             print("🚀 [INITIALIZATION] Setting up SQL query agent with database schema...")
-            print("=" * 70)
-            
-            message = """
-DATABASE SCHEMA LOADED:
-=======================
-
-I have access to a customer data processing pipeline database with 8 main tables:
-
-1. CUSTOMER_MASTER - Main customer information with account details and API keys
-2. CUSTOMER_PREFERENCES - Additional customer configuration and preferences  
-3. API_MASTER - Downstream API definitions and configurations
-4. PIPELINE_MASTER - Abstraction layer over API master with meaningful pipeline names
-5. PIPLELINE_CUSTOMER_CONFIG - Customer-specific pipeline configurations per queue
-6. DI_AUDIT - Audit logs for downstream integration actions and API calls
-7. CASE_MASTER - Main case/file processing table with upload and status information
-8. DOCUMENT_CLASSIFICATION - Individual documents within cases with classification results
-
-Key Relationships:
-- customer_master links to all other tables via customer_id
-- case_master connects to document_classification via case_id
-- pipeline_master connects to api_master via api_id
-- di_audit tracks all downstream actions with full traceability
-
-I'm ready to help you analyze this database! You can:
-- Ask me to find specific data patterns
-- Request complex analytical queries
-- Ask for performance analysis
-- Get help with query optimization
-
-What would you like to explore?
-"""
-        
-        content = types.Content(
-            role='user', 
-            parts=[types.Part.from_text(text=message)]
-        )
+            print(SECTION_RULE)
+            content = user_content(SCHEMA_INIT_MESSAGE)
         
-        async for event in self.runner.run_async(
-            user_id='sql_analyst',
-            session_id=self.session.id,
-            new_message=content,
-        ):
-            if event.content.parts and event.content.parts[0].text:
-                print(f"🤖 SQL Agent: {event.content.parts[0].text}")
+        out = _StreamWriter()
+        async for event in self._run_async(new_message=content):
+            parts = event.content.parts
+            text = parts[0].text if parts else None
+            if text:
+                out.write(f"🤖 SQL Agent: {text}\n")
+        out.flush()
         
-        print("=" * 70)
+        print(SECTION_RULE)
         
     async def send_message(self, message: str):
         """Send a message to the SQL agent."""
-        content = types.Content(
-            role='user', 
-            parts=[types.Part.from_text(text=message)]
-        )
+        content = user_content(message)
         
         print(f"\n👤 User: {message}")
-        print("-" * 50)
-        
-        async for event in self.runner.run_async(
-            user_id='sql_analyst',
-            session_id=self.session.id,
-            new_message=content,
-        ):
-            if event.content.parts and event.content.parts[0].text:
-                print(f"🤖 SQL Agent: {event.content.parts[0].text}")
+        print(TURN_RULE)
+        
+        out = _StreamWriter()
+        async for event in self._run_async(new_message=content):
+            parts = event.content.parts
+            text = parts[0].text if parts else None
+            if text:
+                out.write(f"🤖 SQL Agent: {text}\n")
+        out.flush()
     
     async def run_sample_queries(self):
         """Run some sample queries to demonstrate the agent's capabilities."""
@@ -133,27 +252,45 @@ What would you like to explore?
             "Find customers who have uploaded files but haven't configured any pipelines"
         ]
         
-        for i, query in enumerate(sample_queries, 1):
-            print(f"\n📊 Sample Query {i}:")
-            await self.send_message(query)
+        from sql_agent import db_connection
+        
+        # The queries are independent, so against a live database they run at the
+        # same time, each in its own session so their conversations don't mix.
+        # Simulated execution asks for every result on stdin, so without a
+        # database they run one after another.
+        slots = asyncio.Semaphore(SAMPLE_QUERY_CONCURRENCY if db_connection.connect() else 1)
+        await asyncio.gather(*(
+            self._run_sample_query(i, query, slots) for i, query in enumerate(sample_queries, 1)
+        ))
+    
+    async def _run_sample_query(self, number: int, query: str, slots: asyncio.Semaphore):
+        """Run one sample query in a new session and print its exchange in one block."""
+        async with slots:
+            session = await self.runner.session_service.create_session(
+                app_name='sql_query_agent', user_id='sql_analyst'
+            )
+            content = user_content(query)
             
-            # Add small delay between queries
-            await asyncio.sleep(1)
+            # Buffered so concurrent queries don't interleave their output
+            lines = [f"\n📊 Sample Query {number}:", f"\n👤 User: {query}", TURN_RULE]
+            async for event in self.runner.run_async(
+                user_id='sql_analyst',
+                session_id=session.id,
+                new_message=content,
+            ):
+                parts = event.content.parts
+                text = parts[0].text if parts else None
+                if text:
+                    lines.append(f"🤖 SQL Agent: {text}")
+            print("\n".join(lines))
     
     async def run_interactive_mode(self):
         """Run in interactive mode allowing custom SQL queries and analysis."""
-        print(f"\n💬 [INTERACTIVE MODE] Ask me anything about the database!")
-        print(f"Examples:")
-        print(f"  - 'Find all customers in the Healthcare industry'")
-        print(f"  - 'Show me API performance metrics for last week'")
-        print(f"  - 'Which documents failed classification?'")
-        print(f"  - 'Optimize this query: SELECT * FROM customer_master'")
-        print(f"Type 'quit' to exit, 'demo' to run sample queries, 'schema' for table info")
-        print("-" * 70)
+        print(INTERACTIVE_HELP)
         
         while True:
             try:
-                user_input = input(f"\n👤 SQL Query/Question: ")
+                user_input = await ainput(f"\n👤 SQL Query/Question: ")
                 
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     print(f"\n👋 SQL analysis session ended.")
@@ -178,29 +315,24 @@ What would you like to explore?
             except Exception as e:
                 print(f"\n❌ Error: {e}")
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="PostgreSQL query agent. Without --demo or --query you are prompted for a question.")
+    parser.add_argument("--db-url", help="database URL")
+    parser.add_argument("--demo", action="store_true", help="run the sample analytical queries")
+    parser.add_argument("--query", help="natural language query to start with")
+    return parser.parse_args()
+
+async def main(args: argparse.Namespace):
     """Main entry point."""
-    print("🗃️ PostgreSQL Query Agent")
-    print("=" * 30)
+    bootstrap()
     
-    # Parse command line arguments
-    db_url = None
-    run_demo = False
-    initial_query = None
+    print("🗃️ PostgreSQL Query Agent")
+    print(TITLE_RULE)
     
-    i = 1
-    while i < len(sys.argv):
-        if sys.argv[i] == "--db-url" and i + 1 < len(sys.argv):
-            db_url = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] == "--demo":
-            run_demo = True
-            i += 1
-        elif sys.argv[i] == "--query" and i + 1 < len(sys.argv):
-            initial_query = sys.argv[i + 1]
-            i += 2
-        else:
-            i += 1
+    db_url = args.db_url
+    run_demo = args.demo
+    initial_query = args.query
     
     if db_url:
         print(f"Using database: {db_url}")
@@ -211,7 +343,7 @@ async def main():
     # If no initial query provided via command line, prompt for one
     if not initial_query and not run_demo:
         print("\nEnter your natural language query (or press Enter to skip):")
-        initial_query = input("> ").strip()
+        initial_query = (await ainput()).strip()
         if not initial_query:
             initial_query = None
     
@@ -220,21 +352,29 @@ async def main():
     if run_demo:
         await runner.run_sample_queries()
         
-        print("\n" + "=" * 50)
+        print(PROMPT_RULE)
         print("Demo complete! Switch to interactive mode? (y/n)")
-        choice = input("> ")
+        choice = await ainput()
         if choice.lower().startswith('y'):
             await runner.run_interactive_mode()
     elif not initial_query:
         await runner.run_interactive_mode()
     else:
         # If an initial query was provided, ask if they want to continue with interactive mode
-        print("\n" + "=" * 50)
+        print(PROMPT_RULE)
         print("Query processed! Continue with interactive mode? (y/n)")
-        choice = input("> ")
+        choice = await ainput()
         if choice.lower().startswith('y'):
             await runner.run_interactive_mode()
 
 if __name__ == '__main__':
     print("Starting PostgreSQL Query Agent...")
-    asyncio.run(main()) 
\ No newline at end of file
+    args = parse_args()
+    widen_stdin_buffer()
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        # Ctrl-C while the agent was answering rather than at a prompt
+        print(f"\n\n👋 SQL analysis session ended.") 
\ No newline at end of file
@@ -12,97 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
-import time
-from dotenv import load_dotenv
-from google.adk.agents.run_config import RunConfig
-from google.adk.cli.utils import logs
-from google.adk.runners import InMemoryRunner
-from google.adk.sessions import Session
-from google.genai import types
-
-from agent import root_agent
+"""Scripted test of the weather & time agent.
 
-load_dotenv(override=True)
-logs.log_to_tmp_folder()
+Run it from the repository root as a module, so both the agent package and
+the shared runner plumbing are importable:
 
+    python -m multi_tool_agent.run_agent
+"""
 
-async def main():
-    import pdb; pdb.set_trace()
-    app_name = 'weather_time_app'
-    user_id_1 = 'user1'
-    runner = InMemoryRunner(
-        agent=root_agent,
-        app_name=app_name,
-    )
-    session_11 = await runner.session_service.create_session(
-        app_name=app_name, user_id=user_id_1
-    )
+from pathlib import Path
 
-    async def run_prompt(session: Session, new_message: str):
-        content = types.Content(
-            role='user', parts=[types.Part.from_text(text=new_message)]
-        )
-        print('** User says:', content.model_dump(exclude_none=True))
-        async for event in runner.run_async(
-            user_id=user_id_1,
-            session_id=session.id,
-            new_message=content,
-        ):
-            if event.content.parts and event.content.parts[0].text:
-                print(f'** {event.author}: {event.content.parts[0].text}')
+from google.adk.agents.run_config import RunConfig
+from google.genai import types
 
-    async def run_prompt_bytes(session: Session, new_message: str):
-        content = types.Content(
-            role='user',
-            parts=[
-                types.Part.from_bytes(
-                    data=str.encode(new_message), mime_type='text/plain'
-                )
-            ],
-        )
-        print('** User says:', content.model_dump(exclude_none=True))
-        async for event in runner.run_async(
-            user_id=user_id_1,
-            session_id=session.id,
-            new_message=content,
-            run_config=RunConfig(save_input_blobs_as_artifacts=True),
-        ):
-            if event.content.parts and event.content.parts[0].text:
-                print(f'** {event.author}: {event.content.parts[0].text}')
+from adk_runner_main import run, run_scripted, user_content
+from multi_tool_agent.agent import root_agent
 
-    start_time = time.time()
-    print('Start time:', start_time)
-    print('====================================')
-    print('Testing Weather & Time Agent')
-    print('====================================')
-    
+# The scripted prompts, built once at import and sent in order
+PROMPTS = tuple(user_content(text) for text in (
     # Test weather functionality
-    await run_prompt(session_11, 'Hi there!')
-    await run_prompt(session_11, 'What is the weather like in New York?')
-    await run_prompt(session_11, 'Can you tell me the weather in London?')  # Should show error handling
-    
-    # Test time functionality  
-    await run_prompt(session_11, 'What time is it in New York?')
-    await run_prompt(session_11, 'What time is it in Paris?')  # Should show error handling
-    
+    'Hi there!',
+    'What is the weather like in New York?',
+    'Can you tell me the weather in London?',  # Should show error handling
+    # Test time functionality
+    'What time is it in New York?',
+    'What time is it in Paris?',  # Should show error handling
     # Test combined requests
-    await run_prompt(session_11, 'Can you tell me both the weather and time in New York?')
-    
-    # Test bytes input
-    await run_prompt_bytes(session_11, 'What is the current weather in New York?')
-    
-    print(
-        await runner.artifact_service.list_artifact_keys(
-            app_name=app_name, user_id=user_id_1, session_id=session_11.id
-        )
+    'Can you tell me both the weather and time in New York?',
+)) + (
+    # Test bytes input; the runner saves the blob as an artifact
+    types.Content(
+        role='user',
+        parts=[
+            types.Part.from_bytes(
+                data=b'What is the current weather in New York?', mime_type='text/plain'
+            )
+        ],
+    ),
+)
+
+
+async def main():
+    await run_scripted(
+        root_agent,
+        (PROMPTS,),
+        app_name='weather_time_app',
+        user_id='user1',
+        title='Testing Weather & Time Agent',
+        run_config=RunConfig(save_input_blobs_as_artifacts=True),
     )
-    end_time = time.time()
-    print('====================================')
-    print('End time:', end_time)
-    print('Total time:', end_time - start_time)
 
 
 if __name__ == '__main__':
     print("Starting Weather & Time Agent...")
-    asyncio.run(main()) 
\ No newline at end of file
+    # The API key lives in multi_tool_agent/.env, next to this script
+    run(main(), dotenv_path=Path(__file__).with_name('.env'))
@@ -0,0 +1,76 @@
+"""Interview scheduler agent helpers and the notepad tool."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interview_scheduler_agent"))
+
+import agent
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """Replies the tools read, in order, instead of the terminal."""
+    replies = []
+
+    async def fake_ainput(prompt="> "):
+        return replies.pop(0)
+
+    monkeypatch.setattr(agent, "ainput", fake_ainput)
+    monkeypatch.setattr(agent, "notepad_storage", bytearray())
+    return replies
+
+
+def test_manage_notes_write_append_read(answers):
+    answers.extend(["saved", "saved", ""])
+
+    written = asyncio.run(agent.manage_notes("write", "Call Sarah"))
+    appended = asyncio.run(agent.manage_notes("append", "Email Bob"))
+    read = asyncio.run(agent.manage_notes("read"))
+
+    assert written["status"] == appended["status"] == "success"
+    assert read["current_notes"] == "Call Sarah\nEmail Bob"
+
+
+def test_manage_notes_write_replaces_notes(answers):
+    answers.extend(["saved", "saved", ""])
+
+    asyncio.run(agent.manage_notes("write", "old"))
+    asyncio.run(agent.manage_notes("write", "new"))
+
+    assert asyncio.run(agent.manage_notes("read"))["current_notes"] == "new"
+
+
+def test_manage_notes_failed_write_keeps_notes(answers):
+    answers.extend(["saved", "failed", ""])
+
+    asyncio.run(agent.manage_notes("write", "kept"))
+    result = asyncio.run(agent.manage_notes("append", "lost"))
+
+    assert result["status"] == "error"
+    assert asyncio.run(agent.manage_notes("read"))["current_notes"] == "kept"
+
+
+def test_manage_notes_read_prefers_typed_notes(answers):
+    answers.append("typed in")
+
+    assert asyncio.run(agent.manage_notes("read"))["current_notes"] == "typed in"
+
+
+@pytest.mark.parametrize("text, role", [
+    ("Call the interviewer about availability", "Interviewer"),
+    ("Reach the candidate", "Candidate"),
+    ("Ask HR for the offer letter", "HR/Recruiter"),
+    ("Ask the hiring manager", "Contact"),
+])
+def test_classify_role(text, role):
+    assert agent.classify_role(text, "Contact") == role
+
+
+def test_classify_role_needs_whole_word_hr():
+    assert agent.classify_role("Schedule with Christopher", "Contact") == "Contact"
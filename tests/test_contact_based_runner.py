@@ -0,0 +1,65 @@
+"""Ctrl-C handling in ContactBasedRunner's interactive mode."""
+
+import asyncio
+import os
+import queue
+import signal
+import sys
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interview_scheduler_agent"))
+
+from contact_based_runner import ContactBasedRunner, create_sample_setup
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="needs loop signal handlers")
+
+# Lines for the fake input(); it blocks until one is queued, like a terminal
+typed_lines = queue.SimpleQueue()
+
+
+@pytest.fixture(autouse=True)
+def fake_terminal(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt="": typed_lines.get())
+
+
+async def press_ctrl_c(delay: float = 0.2):
+    await asyncio.sleep(delay)
+    os.kill(os.getpid(), signal.SIGINT)
+
+
+def test_ctrl_c_at_prompt_ends_session(capsys):
+    runner = ContactBasedRunner(create_sample_setup())
+
+    async def scenario():
+        asyncio.ensure_future(press_ctrl_c())
+        await asyncio.wait_for(runner.run_interactive_mode(), timeout=5)
+
+    asyncio.run(scenario())
+    assert "session ended" in capsys.readouterr().out
+
+
+def test_ctrl_c_during_turn_cancels_it(capsys):
+    runner = ContactBasedRunner(create_sample_setup())
+    turns = []
+
+    async def send_message(message):
+        turns.append(message)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            turns.append("cancelled")
+            raise
+
+    runner.send_message = send_message
+    typed_lines.put("When is Sarah free?")
+
+    async def scenario():
+        asyncio.ensure_future(press_ctrl_c(0.5))
+        await asyncio.wait_for(runner.run_interactive_mode(), timeout=5)
+
+    asyncio.run(scenario())
+    assert turns == ["When is Sarah free?", "cancelled"]
+    assert "session ended" in capsys.readouterr().out
@@ -0,0 +1,135 @@
+"""Pure helpers of the SQL agent: query canonicalization, the result cache and schema text."""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interview_scheduler_agent"))
+
+import sql_agent
+from sql_agent import QueryResultCache, _cache_key, _canonicalize, _decompose, _ddl_to_compact, _is_select
+
+
+def test_canonicalize_ignores_formatting_and_comments():
+    messy = "SELECT *  FROM case_master WHERE customer_id = 5 -- newest first\nORDER BY 1"
+    tidy = "select * from case_master where customer_id=5 order by 1"
+
+    assert _canonicalize(messy) == _canonicalize(tidy)
+
+
+def test_canonicalize_lifts_literals_but_keeps_ordinals():
+    canonical, params = _canonicalize("select * from t where id = 5 and name = 'x' order by 1")
+
+    assert canonical == "select*from t where id=$1 and name=$2 order by 1"
+    assert params == ("5", "'x'")
+
+
+def test_canonicalize_keeps_quoted_identifiers_and_typed_literals():
+    canonical, params = _canonicalize("select \"CustomerName\" from t where d > date '2024-01-01'")
+
+    assert '"CustomerName"' in canonical
+    assert "date '2024-01-01'" in canonical
+    assert params == ()
+
+
+def test_cache_key_depends_on_literals_row_limit_and_path():
+    key = _cache_key("select * from t where id = 5", 500)
+
+    assert key == _cache_key("SELECT *\nFROM t WHERE id=5", 500)
+    assert key != _cache_key("select * from t where id = 6", 500)
+    assert key != _cache_key("select * from t where id = 5", 10)
+    assert key != _cache_key("select * from t where id = 5", 500, batched=True)
+
+
+@pytest.mark.parametrize("sql, expected", [
+    ("select 1", True),
+    ("  SELECT 1;", True),
+    ("select ';' from t", True),
+    ("select 1; delete from t", False),
+    ("delete from t", False),
+    ("with x as (delete from t returning *) select * from x", False),
+])
+def test_is_select(sql, expected):
+    assert _is_select(sql) is expected
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(sql_agent.time, "monotonic", fake)
+    return fake
+
+
+def test_query_result_cache_expires_after_ttl(clock):
+    cache = QueryResultCache(ttl=10)
+    cache.put("k", {"rows": []})
+
+    clock.now = 10
+    assert cache.get("k") == {"rows": []}
+    clock.now = 10.5
+    assert cache.get("k") is None
+
+
+def test_query_result_cache_evicts_least_recently_used(clock):
+    cache = QueryResultCache(maxsize=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.get("c") == {"n": 3}
+
+
+def test_query_result_cache_clear(clock):
+    cache = QueryResultCache()
+    cache.put("a", {"n": 1})
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_decompose_splits_explicit_comparisons():
+    objective = "failed cases for acme this week versus failed cases for acme last week"
+
+    assert _decompose(objective) == ["failed cases for acme this week", "failed cases for acme last week"]
+
+
+@pytest.mark.parametrize("objective", [
+    "list cases where status is failed and queue is billing",
+    "customers compared to cases",
+    "show all customers",
+])
+def test_decompose_keeps_single_questions_whole(objective):
+    assert _decompose(objective) == [objective]
+
+
+def test_ddl_to_compact():
+    ddl = """Notes about customers.
+CREATE TABLE public.customer_master (
+    customer_id serial4 NOT NULL,
+    "CustomerName" varchar(100) NULL,
+    CONSTRAINT customer_master_pkey PRIMARY KEY (customer_id)
+);
+CREATE INDEX idx_name ON public.customer_master USING btree ("CustomerName");
+"""
+    lines = _ddl_to_compact(ddl).splitlines()
+
+    assert lines[0] == "Notes about customers."
+    assert lines[1].startswith(
+        'customer_master: customer_id serial4 NOT NULL, "CustomerName" varchar(100) | PK (customer_id) | joins '
+    )
+    assert "case_master on customer_id" in lines[1]
+    assert lines[2] == 'customer_master index idx_name: ("CustomerName")'